@@ -1,10 +1,9 @@
 import argparse
 import os
-from collections import namedtuple
+import sys
 from functools import lru_cache
 
 from detect_secrets import VERSION
-from detect_secrets.plugins.common.util import import_plugins
 
 
 def add_exclude_lines_argument(parser):
@@ -36,6 +35,17 @@ def _is_valid_path(path):  # pragma: no cover
     return path
 
 
+def _argparse_minmax_type(string):
+    """Custom type for argparse to enforce value limits"""
+    value = float(string)
+    if value < 0 or value > 8:
+        raise argparse.ArgumentTypeError(
+            '%s must be between 0.0 and 8.0' % string,
+        )
+
+    return value
+
+
 class TupleAction(argparse.Action):
     def __call__(self, parser, namespace, values, options_string=None):
         existing_values = getattr(
@@ -49,6 +59,36 @@ class TupleAction(argparse.Action):
         )
 
 
+class LazySubParsersAction(argparse._SubParsersAction):
+    """
+    Defers populating a subcommand's arguments until that subcommand
+    is actually selected, so that e.g. `detect-secrets audit` does not
+    pay for building all of `detect-secrets scan`'s options.
+    """
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._deferred_builders = {}
+
+    def defer(self, parser, builder):
+        """
+        :type parser: argparse.ArgumentParser
+        :param parser: subparser returned by `add_parser`
+
+        :type builder: Callable[[], Any]
+        :param builder: populates `parser` with its arguments
+        """
+        self._deferred_builders[parser] = builder
+
+    def __call__(self, parser, namespace, values, option_string=None):
+        subparser = self._name_parser_map.get(values[0])
+        builder = self._deferred_builders.pop(subparser, None)
+        if builder:
+            builder()
+
+        super().__call__(parser, namespace, values, option_string)
+
+
 def add_custom_plugins_argument(parser):
     """
     We turn custom_plugins_paths into a tuple so that we can
@@ -138,14 +178,22 @@ class ParserBuilder:
     def add_console_use_arguments(self):
         subparser = self.parser.add_subparsers(
             dest='action',
+            action=LazySubParsersAction,
         )
 
         for action_parser in (ScanOptions, AuditOptions):
-            action_parser(subparser).add_arguments()
+            options = action_parser(subparser)
+            subparser.defer(options.parser, options.add_arguments)
 
         return self
 
     def parse_args(self, argv):
+        # Nothing else needs to be parsed to display the version, so
+        # skip argparse (and loading plugins) altogether.
+        if argv[:1] == ['--version']:
+            print(VERSION)
+            sys.exit(0)
+
         # We temporarily remove '--help' so that we can give the full
         # amount of options (e.g. --no-custom-detector) after loading
         # custom plugins.
@@ -324,40 +372,43 @@ class AuditOptions:
         return self
 
 
-class PluginDescriptor(
-    namedtuple(
-        'PluginDescriptor',
-        [
-            # Classname of plugin; used for initialization
-            'classname',
-
-            # Flag to disable plugin. e.g. `--no-hex-string-scan`
-            'disable_flag_text',
-
-            # Description for disable flag.
-            'disable_help_text',
-
-            # type: list
-            # Allows the bundling of all related command line provided
-            # arguments together, under one plugin name.
-            # Assumes there is no shared related arg.
-            #
-            # Furthermore, each related arg can have its own default
-            # value (paired together, with a tuple). This allows us to
-            # distinguish the difference between a default value, and
-            # whether a user has entered the same value as a default value.
-            # Therefore, only populate the default value upon consolidation
-            # (rather than relying on argparse default).
-            'related_args',
-        ],
-    ),
-):
-    def __new__(cls, related_args=None, **kwargs):
-        return super(PluginDescriptor, cls).__new__(
-            cls,
-            related_args=related_args or [],
-            **kwargs
-        )
+class PluginDescriptor:
+
+    __slots__ = (
+        # Classname of plugin; used for initialization
+        'classname',
+
+        # Flag to disable plugin. e.g. `--no-hex-string-scan`
+        'disable_flag_text',
+
+        # Description for disable flag.
+        'disable_help_text',
+
+        # type: tuple
+        # Allows the bundling of all related command line provided
+        # arguments together, under one plugin name.
+        # Assumes there is no shared related arg.
+        #
+        # Furthermore, each related arg can have its own default
+        # value (paired together, with a tuple). This allows us to
+        # distinguish the difference between a default value, and
+        # whether a user has entered the same value as a default value.
+        # Therefore, only populate the default value upon consolidation
+        # (rather than relying on argparse default).
+        'related_args',
+    )
+
+    def __init__(
+        self,
+        classname,
+        disable_flag_text,
+        disable_help_text,
+        related_args=None,
+    ):
+        self.classname = classname
+        self.disable_flag_text = disable_flag_text
+        self.disable_help_text = disable_help_text
+        self.related_args = tuple(related_args or ())
 
     @classmethod
     def from_plugin_class(cls, plugin, name):
@@ -365,14 +416,13 @@ class PluginDescriptor(
         :type plugin: Type[TypeVar('Plugin', bound=BasePlugin)]
         :type name: str
         """
-        related_args = None
-        if plugin.default_options:
-            related_args = []
-            for arg_name, value in plugin.default_options.items():
-                related_args.append((
-                    '--{}'.format(arg_name.replace('_', '-')),
-                    value,
-                ))
+        related_args = tuple(
+            (
+                '--{}'.format(arg_name.replace('_', '-')),
+                value,
+            )
+            for arg_name, value in plugin.default_options.items()
+        )
 
         return cls(
             classname=name,
@@ -396,11 +446,45 @@ class PluginDescriptor(
 
 @lru_cache(maxsize=1)
 def get_all_plugin_descriptors(custom_plugin_paths):
-    return [
+    # Local import, so that `--version` and merely importing this module
+    # don't pay for loading the plugin machinery.
+    from detect_secrets.plugins.common.util import import_plugins
+
+    # This is cached, and shared between callers, so it is returned as
+    # tuples (down to each descriptor's related_args) rather than lists
+    # that could be modified in place.
+    return tuple(
         PluginDescriptor.from_plugin_class(plugin, name)
         for name, plugin in
         import_plugins(custom_plugin_paths).items()
-    ]
+    )
+
+
+@lru_cache(maxsize=1)
+def get_plugin_argument_names(custom_plugin_paths):
+    """
+    Converts each plugin's flags into their argparse destinations once,
+    rather than every time arguments are consolidated.
+
+    :rtype: tuple
+    :returns: ((classname, disable_arg_name, ((arg_name, default_value), ...)), ...)
+    """
+    return tuple(
+        (
+            plugin.classname,
+            PluginOptions._convert_flag_text_to_argument_name(
+                plugin.disable_flag_text,
+            ),
+            tuple(
+                (
+                    PluginOptions._convert_flag_text_to_argument_name(flag_name),
+                    default_value,
+                )
+                for flag_name, default_value in plugin.related_args
+            ),
+        )
+        for plugin in get_all_plugin_descriptors(custom_plugin_paths)
+    )
 
 
 class PluginOptions:
@@ -423,11 +507,16 @@ class PluginOptions:
 
     @staticmethod
     def get_disabled_plugins(args):
-        return [
+        """
+        :rtype: frozenset
+        :returns: classnames of plugins that are disabled (i.e. not in
+            args.plugins), for fast membership checks
+        """
+        return frozenset(
             plugin.classname
             for plugin in get_all_plugin_descriptors(args.custom_plugin_paths)
             if plugin.classname not in args.plugins
-        ]
+        )
 
     @staticmethod
     def consolidate_args(args):
@@ -441,47 +530,40 @@ class PluginOptions:
 
         :param args: output of `argparse.ArgumentParser.parse_args`
         """
+        # Working on the namespace's __dict__ directly saves a
+        # getattr/delattr round trip for every plugin argument.
+        args_dict = args.__dict__
+
         # Using `--hex-limit` as a canary to identify whether this
         # consolidation is appropriate.
-        if not hasattr(args, 'hex_limit'):
+        if 'hex_limit' not in args_dict:
             return
 
         active_plugins = {}
         is_using_default_value = {}
 
-        for plugin in get_all_plugin_descriptors(args.custom_plugin_paths):
-            arg_name = PluginOptions._convert_flag_text_to_argument_name(
-                plugin.disable_flag_text,
-            )
-
+        for classname, disable_arg_name, related_arg_names in (
+            get_plugin_argument_names(args.custom_plugin_paths)
+        ):
             # Remove disabled plugins
-            is_disabled = getattr(args, arg_name, False)
-            delattr(args, arg_name)
-            if is_disabled:
+            if args_dict.pop(disable_arg_name, False):
                 continue
 
             # Consolidate related args
             related_args = {}
-            for related_arg_tuple in plugin.related_args:
-                flag_name, default_value = related_arg_tuple
-
-                arg_name = PluginOptions._convert_flag_text_to_argument_name(
-                    flag_name,
-                )
-
-                related_args[arg_name] = getattr(args, arg_name)
-                delattr(args, arg_name)
+            for arg_name, default_value in related_arg_names:
+                related_args[arg_name] = args_dict.pop(arg_name, None)
 
                 if default_value and related_args[arg_name] is None:
                     related_args[arg_name] = default_value
                     is_using_default_value[arg_name] = True
 
             active_plugins.update({
-                plugin.classname: related_args,
+                classname: related_args,
             })
 
-        args.plugins = active_plugins
-        args.is_using_default_value = is_using_default_value
+        args_dict['plugins'] = active_plugins
+        args_dict['is_using_default_value'] = is_using_default_value
 
     def _add_custom_limits(self):
         high_entropy_help_text = (
@@ -491,36 +573,27 @@ class PluginOptions:
 
         self.parser.add_argument(
             '--base64-limit',
-            type=self._argparse_minmax_type,
+            type=_argparse_minmax_type,
             nargs='?',
             help=high_entropy_help_text + 'defaults to 4.5.',
         )
         self.parser.add_argument(
             '--hex-limit',
-            type=self._argparse_minmax_type,
+            type=_argparse_minmax_type,
             nargs='?',
             help=high_entropy_help_text + 'defaults to 3.0.',
         )
 
     def add_opt_out_options(self, custom_plugin_paths):
+        add_argument = self.parser.add_argument
         for plugin in get_all_plugin_descriptors(custom_plugin_paths):
-            self.parser.add_argument(
+            add_argument(
                 plugin.disable_flag_text,
                 action='store_true',
                 help=plugin.disable_help_text,
                 default=False,
             )
 
-    def _argparse_minmax_type(self, string):
-        """Custom type for argparse to enforce value limits"""
-        value = float(string)
-        if value < 0 or value > 8:
-            raise argparse.ArgumentTypeError(
-                '%s must be between 0.0 and 8.0' % string,
-            )
-
-        return value
-
     @staticmethod
     def _convert_flag_text_to_argument_name(flag_text):
         """This just emulates argparse's underlying logic.
@@ -10,12 +10,13 @@ from monotonic import monotonic
 
 from detect_secrets.core.color import AnsiColor
 from detect_secrets.core.color import colorize
-from detect_secrets.core.usage import PluginOptions
+from detect_secrets.core.usage import get_all_plugin_descriptors
 from detect_secrets.util import get_root_directory
 
 
 def main():
-    args = get_arguments()
+    plugin_descriptors = get_all_plugin_descriptors(())
+    args = get_arguments(plugin_descriptors)
 
     print(
         'Running performance tests on: {}'.format(
@@ -31,7 +32,7 @@ def main():
     # First, convert chosen plugins into their disabled flags
     always_disabled_plugins = []
     flag_list = {}
-    for info in PluginOptions.all_plugins:
+    for info in plugin_descriptors:
         if info.classname in args.plugin:
             flag_list[info.disable_flag_text] = info.classname
         else:
@@ -40,7 +41,7 @@ def main():
     # Then, iterate through each disabled flag, toggling them off
     # individually.
     timings = {}
-    if len(args.plugin) == len(PluginOptions.all_plugins):
+    if len(args.plugin) == len(plugin_descriptors):
         # Only run benchmarks for all the cases, if already running all plugins
         timings['all-plugins'] = time_execution(
             filenames=args.filenames,
@@ -63,10 +64,10 @@ def main():
     print_output(timings, args)
 
 
-def get_arguments():
+def get_arguments(plugin_descriptors):
     plugins = [
         info.classname
-        for info in PluginOptions.all_plugins
+        for info in plugin_descriptors
     ]
 
     parser = argparse.ArgumentParser(description='Run some benchmarks.')
@@ -1,6 +1,14 @@
+import argparse
+
+import mock
 import pytest
 
+from detect_secrets import VERSION
+from detect_secrets.core.usage import LazySubParsersAction
+from detect_secrets.core.usage import ParserBuilder
+from detect_secrets.core.usage import PluginOptions
 from detect_secrets.plugins.common.util import import_plugins
+from testing.util import _parse_console_use_args_with_correct_prog
 from testing.util import parse_pre_commit_args_with_correct_prog
 
 
@@ -38,6 +46,7 @@ class TestPluginOptions:
         args = parse_pre_commit_args_with_correct_prog('--no-private-key-scan')
 
         assert 'PrivateKeyDetector' not in args.plugins
+        assert 'PrivateKeyDetector' in PluginOptions.get_disabled_plugins(args)
 
     def test_help(self):
         with pytest.raises(SystemExit):
@@ -84,3 +93,39 @@ class TestPluginOptions:
         else:
             with pytest.raises(SystemExit):
                 parse_pre_commit_args_with_correct_prog(argument_string)
+
+
+class TestConsoleUseArguments:
+
+    def test_only_builds_selected_subcommand(self):
+        builder = ParserBuilder().add_console_use_arguments()
+        builder.parse_args(['audit', 'baseline.json'])
+
+        subparsers = next(
+            action
+            for action in builder.parser._actions
+            if isinstance(action, LazySubParsersAction)
+        ).choices
+        assert '--diff' in subparsers['audit']._option_string_actions
+        assert '--exclude-files' not in subparsers['scan']._option_string_actions
+
+
+class TestVersion:
+
+    @pytest.mark.parametrize(
+        'parse_args',
+        [
+            parse_pre_commit_args_with_correct_prog,
+            _parse_console_use_args_with_correct_prog,
+        ],
+    )
+    def test_version_skips_argparse(self, parse_args, capsys):
+        with mock.patch.object(
+            argparse.ArgumentParser,
+            'parse_known_args',
+        ) as mock_parse_known_args, pytest.raises(SystemExit) as e:
+            parse_args('--version')
+
+        assert not mock_parse_known_args.called
+        assert e.value.code == 0
+        assert capsys.readouterr().out == '{}\n'.format(VERSION)